@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Native keyboard backends that inject keystrokes without PyAutoGUI
+
+Each backend exposes build_buffer(text), which prepares the events for
+the whole text once, and send(buffer, start, end), which types
+text[start:end] into the focused window from that buffer with as few
+platform calls as possible. cursor_in_corner() reports whether the
+mouse is in a corner of the primary screen, so callers can keep
+PyAutoGUI's fail-safe. get_backend() returns None when no native
+backend can be used, in which case callers fall back to AppleScript or
+PyAutoGUI.
+"""
+import ctypes
+import platform
+
+SYSTEM = platform.system()
+
+
+# Windows SendInput structures (defined with fixed-size types so this
+# module can be imported on every platform)
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+# Characters that must be sent as virtual keys rather than Unicode
+WINDOWS_VIRTUAL_KEYS = {
+    '\n': 0x0D,  # VK_RETURN
+    '\t': 0x09,  # VK_TAB
+}
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_uint16),
+        ("wScan", ctypes.c_uint16),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", ctypes.c_uint32),
+        ("wParamL", ctypes.c_uint16),
+        ("wParamH", ctypes.c_uint16),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [
+        ("mi", MOUSEINPUT),
+        ("ki", KEYBDINPUT),
+        ("hi", HARDWAREINPUT),
+    ]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("union", _INPUTUNION),
+    ]
+
+
+class POINT(ctypes.Structure):
+    _fields_ = [
+        ("x", ctypes.c_int32),
+        ("y", ctypes.c_int32),
+    ]
+
+
+def in_corner(x, y, width, height):
+    """Whether (x, y) is a corner of a width x height screen
+
+    Same points as PyAutoGUI's FAILSAFE_POINTS.
+    """
+    return x in (0, width - 1) and y in (0, height - 1)
+
+
+class WindowsBackend:
+    """Type text with one user32.SendInput call per chunk"""
+
+    def __init__(self):
+        self.user32 = ctypes.windll.user32
+        self.send_input = self.user32.SendInput
+        self.input_size = ctypes.sizeof(INPUT)
+
+    def build_buffer(self, text):
+        """Build one contiguous INPUT array covering the whole text
+
+        Returns (events, starts) where starts[i] is the index of the first
+        event for text[i], so any slice of text maps to a slice of events.
+        """
+        keys = []
+        starts = []
+        for char in text:
+            starts.append(2 * len(keys))
+            if char in WINDOWS_VIRTUAL_KEYS:
+                keys.append((WINDOWS_VIRTUAL_KEYS[char], 0, 0))
+            else:
+                # Characters outside the BMP are sent as surrogate pairs
+                encoded = char.encode('utf-16-le')
+                for i in range(0, len(encoded), 2):
+                    unit = int.from_bytes(encoded[i:i + 2], 'little')
+                    keys.append((0, unit, KEYEVENTF_UNICODE))
+        starts.append(2 * len(keys))
+
+        events = (INPUT * (2 * len(keys)))()
+        for i, (vk, scan, flags) in enumerate(keys):
+            for j, up_flag in enumerate((0, KEYEVENTF_KEYUP)):
+                event = events[2 * i + j]
+                event.type = INPUT_KEYBOARD
+                event.union.ki.wVk = vk
+                event.union.ki.wScan = scan
+                event.union.ki.dwFlags = flags | up_flag
+        return events, starts
+
+    def send(self, buffer, start, end):
+        """Send the events for text[start:end] in a single SendInput call"""
+        events, starts = buffer
+        first = starts[start]
+        count = starts[end] - first
+        if count:
+            self.send_input(
+                count,
+                ctypes.byref(events, first * self.input_size),
+                self.input_size
+            )
+
+    def cursor_in_corner(self):
+        """Whether the mouse is in a corner of the primary screen"""
+        point = POINT()
+        self.user32.GetCursorPos(ctypes.byref(point))
+        return in_corner(
+            point.x, point.y,
+            self.user32.GetSystemMetrics(0),  # SM_CXSCREEN
+            self.user32.GetSystemMetrics(1)   # SM_CYSCREEN
+        )
+
+
+class QuartzBackend:
+    """Post Unicode keyboard events directly with Quartz (macOS only)"""
+
+    # Virtual key codes for characters apps expect as real keys
+    KEY_CODES = {
+        '\n': 36,  # Return key
+        '\t': 48,  # Tab key
+    }
+
+    def __init__(self):
+        import Quartz
+        self.quartz = Quartz
+        # Events are created once and reused for every keystroke; posting
+        # copies them, so only the Unicode string changes per character
+        self.unicode_events = self.create_events(0)
+        self.key_events = {
+            char: self.create_events(key_code)
+            for char, key_code in self.KEY_CODES.items()
+        }
+
+    def create_events(self, key_code):
+        """Create a keydown/keyup event pair for a virtual key code"""
+        return tuple(
+            self.quartz.CGEventCreateKeyboardEvent(None, key_code, key_down)
+            for key_down in (True, False)
+        )
+
+    def build_buffer(self, text):
+        """Quartz events are posted from the text directly"""
+        return text
+
+    def send(self, buffer, start, end):
+        """Post a keydown/keyup event pair per char of buffer[start:end]"""
+        quartz = self.quartz
+        set_unicode_string = quartz.CGEventKeyboardSetUnicodeString
+        post = quartz.CGEventPost
+        tap = quartz.kCGHIDEventTap
+        for char in buffer[start:end]:
+            events = self.key_events.get(char)
+            if events is None:
+                events = self.unicode_events
+                length = len(char.encode('utf-16-le')) // 2
+                for event in events:
+                    set_unicode_string(event, length, char)
+            for event in events:
+                post(tap, event)
+
+    def cursor_in_corner(self):
+        """Whether the mouse is in a corner of the main display"""
+        quartz = self.quartz
+        location = quartz.CGEventGetLocation(quartz.CGEventCreate(None))
+        bounds = quartz.CGDisplayBounds(quartz.CGMainDisplayID())
+        return in_corner(
+            int(location.x), int(location.y),
+            int(bounds.size.width), int(bounds.size.height)
+        )
+
+
+class XTestBackend:
+    """Fake key events through the XTest extension (Linux/X11 only)"""
+
+    def __init__(self):
+        from Xlib import X, XK, display
+        from Xlib.ext import xtest
+        self.X = X
+        self.XK = XK
+        self.xtest = xtest
+        self.display = display.Display()
+        self.shift_keycode = self.display.keysym_to_keycode(
+            XK.string_to_keysym('Shift_L')
+        )
+        # Cache of char -> (keycode, needs_shift), or None if unmapped
+        self.key_cache = {}
+
+    def _lookup(self, char):
+        """Resolve a character to a keycode and shift state"""
+        if char not in self.key_cache:
+            if char == '\n':
+                keysym = self.XK.string_to_keysym('Return')
+            elif char == '\t':
+                keysym = self.XK.string_to_keysym('Tab')
+            elif ord(char) < 0x100:
+                # Latin-1 keysyms match their code points
+                keysym = ord(char)
+            else:
+                keysym = 0x01000000 | ord(char)
+
+            self.key_cache[char] = None
+            for keycode, index in self.display.keysym_to_keycodes(keysym):
+                if index in (0, 1):
+                    self.key_cache[char] = (keycode, index == 1)
+                    break
+        return self.key_cache[char]
+
+    def build_buffer(self, text):
+        """Resolve every character's keycode once"""
+        return [self._lookup(char) for char in text]
+
+    def send(self, buffer, start, end):
+        """Queue every key event for buffer[start:end], then flush once"""
+        X = self.X
+        fake_input = self.xtest.fake_input
+        for key in buffer[start:end]:
+            if key is None:
+                # Character is not on the current keyboard layout
+                continue
+            keycode, needs_shift = key
+            if needs_shift:
+                fake_input(self.display, X.KeyPress, self.shift_keycode)
+            fake_input(self.display, X.KeyPress, keycode)
+            fake_input(self.display, X.KeyRelease, keycode)
+            if needs_shift:
+                fake_input(self.display, X.KeyRelease, self.shift_keycode)
+        self.display.sync()
+
+    def cursor_in_corner(self):
+        """Whether the mouse is in a corner of the primary screen"""
+        screen = self.display.screen()
+        pointer = screen.root.query_pointer()
+        return in_corner(
+            pointer.root_x, pointer.root_y,
+            screen.width_in_pixels, screen.height_in_pixels
+        )
+
+
+def begin_precise_timing():
+    """Raise the system timer resolution to 1ms (Windows only)
+
+    Windows rounds sleeps up to ~15.6ms by default; call
+    end_precise_timing() when typing finishes to restore it.
+    """
+    if SYSTEM == 'Windows':
+        ctypes.windll.winmm.timeBeginPeriod(1)
+
+
+def end_precise_timing():
+    """Undo begin_precise_timing()"""
+    if SYSTEM == 'Windows':
+        ctypes.windll.winmm.timeEndPeriod(1)
+
+
+def get_backend():
+    """Return the native backend for this platform, or None"""
+    backends = {
+        'Windows': WindowsBackend,
+        'Darwin': QuartzBackend,
+        'Linux': XTestBackend,
+    }
+    backend_class = backends.get(SYSTEM)
+    if backend_class is None:
+        return None
+    try:
+        return backend_class()
+    except Exception:
+        # Missing optional dependency (pyobjc, python-xlib) or no display
+        return None
@@ -1,22 +1,35 @@
 #!/usr/bin/env python3
+import re
 import sys
 import time
-import random
 import threading
-import pyautogui
-import pyperclip
 import subprocess
 import platform
+import backend_type
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTextEdit, QSlider, QSpinBox, QCheckBox,
     QProgressBar, QMessageBox, QGroupBox
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QShortcut, QKeySequence
 
 # Check if we're on macOS
 IS_MACOS = platform.system() == 'Darwin'
 
+# Characters followed by a slightly longer pause on macOS
+PAUSE_CHARS = frozenset('.,!?;: \n\t')
+
+# Shortest sleep worth scheduling; keystrokes due closer together than
+# this are sent together instead of waking the thread for each one
+MIN_SLEEP = 0.015
+
+# Reported when the mouse is moved to a screen corner during typing
+FAILSAFE_MESSAGE = "Fail-safe triggered: mouse moved to a screen corner"
+
+# Minimum time between progress bar updates from the typing thread (~30Hz)
+PROGRESS_INTERVAL = 0.033
+
 # For Mac, we'll use multiple methods to type special characters
 MAC_SPECIAL_CHARS = {
     '#': 'numbersign',
@@ -43,52 +56,189 @@ MAC_SPECIAL_CHARS = {
     '`': 'grave'
 }
 
-def type_with_applescript(text):
-    """Use AppleScript to type text (macOS only)"""
-    for char in text:
-        # Handle special characters including whitespace
-        if char == '\n':
-            # Type return/enter key for newlines
-            apple_script = '''
-            tell application "System Events"
-                key code 36  # Return key
-            end tell
-            '''
-        elif char == ' ':
-            # Type space
-            apple_script = '''
-            tell application "System Events"
-                key code 49  # Space key
-            end tell
-            '''
-        elif char == '\t':
-            # Type tab
-            apple_script = '''
-            tell application "System Events"
-                key code 48  # Tab key
-            end tell
-            '''
+# PyAutoGUI probes the display when imported, so it (and pyperclip) are
+# only loaded by load_pyautogui() / load_pyperclip() when needed
+pyautogui = None
+pyperclip = None
+
+def load_pyperclip():
+    """Import pyperclip on first use"""
+    global pyperclip
+    if pyperclip is None:
+        import pyperclip
+
+def load_pyautogui():
+    """Import PyAutoGUI and pyperclip on first use"""
+    global pyautogui
+    load_pyperclip()
+    if pyautogui is None:
+        import pyautogui
+        # The delay schedule is the only source of inter-key timing, so
+        # drop PyAutoGUI's automatic 0.1s pause after every call; keep
+        # the corner fail-safe, which the native backends also check
+        pyautogui.PAUSE = 0
+        pyautogui.FAILSAFE = True
+
+# pynput provides the global ESC hotkey; set to False once its import
+# has failed so it isn't retried on every run
+pynput_keyboard = None
+
+def load_pynput_keyboard():
+    """Import pynput's keyboard module on first use, or return None"""
+    global pynput_keyboard
+    if pynput_keyboard is None:
+        try:
+            from pynput import keyboard as pynput_keyboard
+        except ImportError:
+            pynput_keyboard = False
+    return pynput_keyboard or None
+
+# AppleScript lines for whitespace, which is sent as key codes
+APPLESCRIPT_KEY_CODES = {
+    '\n': 'key code 36',  # Return key
+    ' ': 'key code 49',  # Space key
+    '\t': 'key code 48',  # Tab key
+}
+APPLESCRIPT_KEYSTROKE = 'keystroke "%s"'
+APPLESCRIPT_DELAY = 'delay %s'
+APPLESCRIPT_LOG = 'log "%d"'
+# Backslashes and double quotes must be escaped in AppleScript strings
+APPLESCRIPT_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+def applescript_line(char):
+    """Return the AppleScript command that types one character"""
+    line = APPLESCRIPT_KEY_CODES.get(char)
+    if line is None:
+        # Type regular character
+        line = APPLESCRIPT_KEYSTROKE % char.translate(APPLESCRIPT_ESCAPES)
+    return line
+
+def start_applescript(text, delays, chunks):
+    """Type text with a single osascript process (macOS only)
+
+    The script for the whole text is written to osascript's stdin, with
+    delays[i] seconds waited after text[i]. After each (start, end, ...)
+    chunk the script logs `end` to stderr, so the caller can follow
+    progress with process.stderr.readline().
+    """
+    lines = ['tell application "System Events"']
+    for start, end, _ in chunks:
+        for index in range(start, end):
+            lines.append(applescript_line(text[index]))
+            if index < end - 1:
+                lines.append(APPLESCRIPT_DELAY % delays[index])
+        lines.append(APPLESCRIPT_LOG % end)
+        # The delay after the chunk's last key follows its progress marker
+        if end < len(text):
+            lines.append(APPLESCRIPT_DELAY % delays[end - 1])
+    lines.append('end tell')
+
+    process = subprocess.Popen(
+        ['osascript', '-'], stdin=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    process.stdin.write('\n'.join(lines))
+    process.stdin.close()
+    return process
+
+def paste_with_applescript(text):
+    """Paste the whole text at once with Cmd-V (macOS only)"""
+    load_pyperclip()
+    original_clipboard = pyperclip.paste()
+    pyperclip.copy(text)
+    try:
+        result = subprocess.run(
+            ['osascript', '-e',
+             'tell application "System Events" to keystroke "v" '
+             'using command down'],
+            stderr=subprocess.PIPE, universal_newlines=True, check=False
+        )
+        if result.returncode != 0:
+            # e.g. no Accessibility permission to send keystrokes
+            raise RuntimeError(
+                result.stderr.strip()
+                or f"osascript exited with status {result.returncode}"
+            )
+        # Give the target app time to read the clipboard before restoring it
+        time.sleep(0.2)
+    finally:
+        pyperclip.copy(original_clipboard)
+
+# Splits text into runs of regular characters and single special chars
+PYAUTOGUI_TOKEN = re.compile(
+    '[^' + re.escape(''.join(MAC_SPECIAL_CHARS)) + ']+|.', re.DOTALL
+)
+
+# Splits text into words, each ending with a single whitespace character
+WORD_CHUNK = re.compile(r'\S*\s|\S+')
+
+def type_with_pyautogui(text, saved_clipboard):
+    """Use PyAutoGUI to type text, one call per run of regular characters
+
+    saved_clipboard is a list shared across a typing run; the user's
+    clipboard is stored in it the first time the clipboard fallback is
+    used so the caller can restore it once when typing ends.
+    """
+    write = pyautogui.write
+    for token in PYAUTOGUI_TOKEN.findall(text):
+        # Special characters are single tokens; one lookup finds the key
+        key_name = MAC_SPECIAL_CHARS.get(token)
+        # Try multiple approaches for special characters
+        if key_name is not None:
+            try:
+                # First try: use direct key press
+                pyautogui.press(key_name)
+            except Exception:
+                try:
+                    # Second try: use clipboard method
+                    if not saved_clipboard:
+                        saved_clipboard.append(pyperclip.paste())
+                    pyperclip.copy(token)
+                    pyautogui.hotkey('ctrl', 'v')
+                    # Let the target app read it before the next copy
+                    time.sleep(0.1)
+                except:
+                    # Last resort: try to write directly
+                    write(token)
         else:
-            # Escape double quotes for AppleScript
-            escaped_char = char.replace('"', '\\"')
-            # Type regular character
-            apple_script = f'''
-            tell application "System Events"
-                keystroke "{escaped_char}"
-            end tell
-            '''
-        
-        # Run the AppleScript command
-        subprocess.run(['osascript', '-e', apple_script], check=False)
-        
-        # Small delay after each character to ensure proper typing
-        time.sleep(0.01)
+            # Type the whole run of regular characters in one call
+            write(token)
 
 class SimpleTyper(QMainWindow):
     """Simplified Auto Typer with emergency stop feature"""
 
-    # Signal for progress updates
+    # Signals from the typing thread: progress, success and failure
     progress_signal = pyqtSignal(int)
+    completed_signal = pyqtSignal()
+    error_signal = pyqtSignal(str)
+
+    # Signal for ESC pressed while another application has focus
+    emergency_signal = pyqtSignal()
+
+    # Status label text and style for each state
+    STATUS_STYLES = {
+        'ready': (
+            "Ready",
+            "background-color: #e0e0e0; padding: 5px; border-radius: 3px;"
+        ),
+        'typing': (
+            "Typing",
+            "background-color: #fff3cd; padding: 5px; border-radius: 3px;"
+        ),
+        'completed': (
+            "Completed",
+            "background-color: #d4edda; padding: 5px; border-radius: 3px;"
+        ),
+        'stopped': (
+            "Stopped",
+            "background-color: #f8d7da; padding: 5px; border-radius: 3px;"
+        ),
+        'emergency': (
+            "EMERGENCY STOP",
+            "background-color: #dc3545; color: white; "
+            "padding: 5px; border-radius: 3px;"
+        ),
+    }
 
     def __init__(self):
         super().__init__()
@@ -98,20 +248,41 @@ class SimpleTyper(QMainWindow):
         # Variables
         self.typing_active = False
         self.paused = False
+        # Set to stop the typing thread; also wakes it from its delay.
+        # Each run gets a new event, so a previous run's thread that is
+        # still winding down can't be revived by clearing it
+        self.stop_event = threading.Event()
         self.typing_thread = None
-        self.emergency_timer = None
+        # osascript process of the current run on the AppleScript fallback
+        self.applescript = None
         self.emergency_time = 10  # Auto-stop after 10 seconds by default
 
         # Basic settings
         self.delay = 0.1
-        
+        self.fast_paste = False  # Paste the whole text at once (macOS)
+
+        # Native keystroke backend (None falls back to AppleScript/PyAutoGUI)
+        # Loaded by the first typing run to keep it off the startup path
+        self.backend = None
+        self.backend_loaded = False
+
+        # Message boxes, created on first use and reused (see show_message)
+        self.message_boxes = {}
+
         # Create UI
         self.init_ui()
 
-        # Safety fallback - never let typing run for more than 30 seconds
-        self.max_timer = QTimer(self)
-        self.max_timer.timeout.connect(self.emergency_stop)
-        self.max_timer.setSingleShot(True)
+        # Auto-stop: emergency stop once typing has run for emergency_time
+        self.emergency_timer = QTimer(self)
+        self.emergency_timer.timeout.connect(self.emergency_stop)
+        self.emergency_timer.setSingleShot(True)
+
+        # Drives the start countdown without blocking the event loop
+        self.countdown_timer = QTimer(self)
+        self.countdown_timer.timeout.connect(self.countdown_tick)
+        self.countdown_timer.setSingleShot(True)
+        self.countdown_remaining = 0
+        self.pending_text = None
 
     def init_ui(self):
         """Create the user interface"""
@@ -129,6 +300,8 @@ class SimpleTyper(QMainWindow):
         text_layout.addWidget(self.text_input)
 
         # Character count
+        self.char_count = 0
+        self.char_count_pending = False
         self.char_count_label = QLabel("Characters: 0")
         text_layout.addWidget(self.char_count_label)
 
@@ -169,6 +342,14 @@ class SimpleTyper(QMainWindow):
         emergency_layout.addWidget(self.emergency_spinbox)
 
         options_layout.addLayout(emergency_layout)
+
+        # Fast paste mode: one Cmd-V instead of typing each character
+        if IS_MACOS:
+            self.fast_paste_checkbox = QCheckBox("Fast paste mode (macOS)")
+            self.fast_paste_checkbox.setChecked(self.fast_paste)
+            self.fast_paste_checkbox.toggled.connect(self.update_fast_paste)
+            options_layout.addWidget(self.fast_paste_checkbox)
+
         options_layout.addStretch()
 
         controls_layout.addLayout(options_layout)
@@ -177,10 +358,9 @@ class SimpleTyper(QMainWindow):
         button_layout = QHBoxLayout()
 
         # Status label
-        self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet(
-            "background-color: #e0e0e0; padding: 5px; border-radius: 3px;"
-        )
+        self.status = None
+        self.status_label = QLabel()
+        self.set_status('ready')
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         button_layout.addWidget(self.status_label)
 
@@ -234,26 +414,59 @@ class SimpleTyper(QMainWindow):
         # Set central widget
         self.setCentralWidget(central_widget)
 
+        # Created up front so showing a message doesn't resize the layout
+        self.status_bar = self.statusBar()
+
         # Connect text change to update character count
         self.text_input.textChanged.connect(self.update_char_count)
 
-        # Connect progress signal
-        self.progress_signal.connect(self.update_progress)
+        # Connect typing thread signals; they are queued to the GUI thread
+        self.progress_signal.connect(
+            self.update_progress, Qt.ConnectionType.QueuedConnection
+        )
+        self.completed_signal.connect(
+            self.typing_completed, Qt.ConnectionType.QueuedConnection
+        )
+        self.error_signal.connect(
+            self.typing_failed, Qt.ConnectionType.QueuedConnection
+        )
+
+        # Global ESC listener (started per run, emitted from its thread)
+        self.esc_listener = None
+        self.emergency_signal.connect(
+            self.emergency_stop, Qt.ConnectionType.QueuedConnection
+        )
 
-        # Set keyboard shortcut for emergency stop
-        self.shortcut = None
-        try:
-            # Try to set keyboard shortcut for ESC key
-            from PyQt6.QtGui import QShortcut, QKeySequence
-            self.shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
-            self.shortcut.activated.connect(self.emergency_stop)
-        except Exception:
-            print("Could not set keyboard shortcut for emergency stop")
+        # ESC stops typing while this window has focus; the global
+        # listener (see start_esc_listener) covers other windows
+        self.shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
+        self.shortcut.activated.connect(self.emergency_stop)
+
+    def set_status(self, status, text=None):
+        """Show a status, restyling the label only when the state changes"""
+        default_text, style = self.STATUS_STYLES[status]
+        self.status_label.setText(text or default_text)
+        if status != self.status:
+            self.status = status
+            self.status_label.setStyleSheet(style)
 
     def update_char_count(self):
+        """Schedule a character count update, coalescing bursts of edits"""
+        if self.char_count_pending:
+            return
+        self.char_count_pending = True
+        QTimer.singleShot(50, self.flush_char_count)
+
+    def flush_char_count(self):
         """Update character count display"""
-        text = self.text_input.toPlainText()
-        self.char_count_label.setText(f"Characters: {len(text)}")
+        self.char_count_pending = False
+        # Count the text that will be typed; characterCount() would count
+        # UTF-16 units and rich-text objects instead. Edits are coalesced
+        # by update_char_count(), so copying the text here is cheap enough
+        count = len(self.text_input.toPlainText())
+        if count != self.char_count:
+            self.char_count = count
+            self.char_count_label.setText(f"Characters: {count}")
 
     def update_speed(self):
         """Update typing speed from slider"""
@@ -264,6 +477,10 @@ class SimpleTyper(QMainWindow):
         """Update emergency stop timer value"""
         self.emergency_time = self.emergency_spinbox.value()
 
+    def update_fast_paste(self):
+        """Update fast paste mode from checkbox"""
+        self.fast_paste = self.fast_paste_checkbox.isChecked()
+
     def update_progress(self, value):
         """Update progress bar"""
         self.progress_bar.setValue(value)
@@ -277,8 +494,8 @@ class SimpleTyper(QMainWindow):
         # Get the text to type
         text = self.text_input.toPlainText().strip()
         if not text:
-            QMessageBox.information(
-                self,
+            self.show_message(
+                QMessageBox.Icon.Information,
                 "No Text",
                 "Please enter some text to type"
             )
@@ -290,8 +507,8 @@ class SimpleTyper(QMainWindow):
         ok_button = QMessageBox.StandardButton.Ok
         cancel_button = QMessageBox.StandardButton.Cancel
         buttons = ok_button | cancel_button
-        result = QMessageBox.question(
-            self, "Ready to Type",
+        result = self.show_message(
+            QMessageBox.Icon.Question, "Ready to Type",
             msg_pt1 + msg_pt2,
             buttons
         )
@@ -299,121 +516,273 @@ class SimpleTyper(QMainWindow):
         if result != QMessageBox.StandardButton.Ok:
             return
 
-        # Start emergency timer
-        self.max_timer.start(self.emergency_time * 1000)
-
-        # Start typing thread
         self.typing_active = True
-        self.typing_thread = threading.Thread(
-            target=self.typing_process,
-            args=(text,)
-        )
-        self.typing_thread.daemon = True
+        self.stop_event = threading.Event()
 
         # Update UI
-        self.status_label.setText("Typing")
-        self.status_label.setStyleSheet(
-            "background-color: #fff3cd; padding: 5px; border-radius: 3px;"
-        )
+        self.set_status('typing')
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
 
-        # Give time to position cursor
-        for i in range(3, 0, -1):
-            self.status_label.setText(f"Starting in {i}...")
-            QApplication.processEvents()
-            time.sleep(1)
+        # Give time to position cursor; the window stays responsive, so
+        # STOP and ESC work during the countdown
+        self.start_esc_listener()
+        self.pending_text = text
+        self.countdown_remaining = 3
+        self.countdown_tick()
+
+    def start_esc_listener(self):
+        """Listen for ESC system-wide while typing into another window"""
+        # The window-level shortcut only fires when this window has focus,
+        # which it doesn't while typing elsewhere
+        keyboard = load_pynput_keyboard()
+        if keyboard is None:
+            self.status_bar.showMessage(
+                "pynput is not installed; ESC only stops typing while "
+                "this window has focus"
+            )
+            return
+        try:
+            self.esc_listener = keyboard.GlobalHotKeys(
+                {'<esc>': self.emergency_signal.emit}
+            )
+            self.esc_listener.start()
+        except Exception as exception:
+            # e.g. no accessibility permission or no X display; typing
+            # still goes ahead with the window shortcut only
+            self.esc_listener = None
+            self.show_error(
+                f"Could not start global ESC listener: {exception}"
+            )
+
+    def stop_esc_listener(self):
+        """Remove the global ESC listener, if any"""
+        if self.esc_listener is not None:
+            self.esc_listener.stop()
+            self.esc_listener = None
+
+    def countdown_tick(self):
+        """Show the next countdown step, then start the typing thread"""
+        if not self.typing_active:
+            return
+
+        if self.countdown_remaining > 0:
+            self.set_status(
+                'typing', f"Starting in {self.countdown_remaining}..."
+            )
+            self.countdown_remaining -= 1
+            self.countdown_timer.start(1000)
+            return
+
+        # Start emergency timer once typing actually begins
+        self.emergency_timer.start(self.emergency_time * 1000)
 
-        self.status_label.setText("Typing")
+        # Start typing thread
+        self.set_status('typing')
+        self.typing_thread = threading.Thread(
+            target=self.typing_process,
+            args=(self.pending_text, self.stop_event)
+        )
+        self.typing_thread.daemon = True
+        self.pending_text = None
         self.typing_thread.start()
 
-    def typing_process(self, text):
-        """The actual typing process in a separate thread"""
+    def build_delay_schedule(self, text):
+        """Compute the delay after each character before typing starts"""
+        delay = self.delay
+        if not IS_MACOS:
+            return [delay] * len(text)
+
+        # On macOS, slightly longer pause for certain characters
+        pause_delay = delay * 1.5
+        return [pause_delay if char in PAUSE_CHARS else delay for char in text]
+
+    def group_schedule(self, schedule):
+        """Merge consecutive keystrokes whose delays are below MIN_SLEEP
+
+        Returns (start, end, delay) chunks: text[start:end] is typed with
+        one backend call, followed by a single sleep of the summed delay.
+        """
+        chunks = []
+        start = 0
+        pending = 0.0
+        for index, char_delay in enumerate(schedule):
+            pending += char_delay
+            if pending >= MIN_SLEEP:
+                chunks.append((start, index + 1, pending))
+                start = index + 1
+                pending = 0.0
+        if start < len(schedule):
+            chunks.append((start, len(schedule), pending))
+        return chunks
+
+    def group_words(self, text, schedule):
+        """Split the text into words, each ending with its whitespace
+
+        Returns (start, end, delay) chunks like group_schedule(), where
+        delay is the total of every character's delay in the chunk.
+        """
+        chunks = []
+        for match in WORD_CHUNK.finditer(text):
+            start, end = match.span()
+            chunks.append((start, end, sum(schedule[start:end])))
+        return chunks
+
+    def typing_process(self, text, stop_event):
+        """The actual typing process in a separate thread
+
+        Typing stops when stop_event, the event of this run, is set.
+        """
+        # Accurate sleeps for the duration of the run (Windows only)
+        backend_type.begin_precise_timing()
+        # User clipboard, if the PyAutoGUI clipboard fallback replaces it
+        saved_clipboard = []
+        # osascript process typing the text when AppleScript is used
+        applescript = None
         try:
             # Calculate total characters to type
             total_chars = len(text)
             typed_chars = 0
-
-            # For macOS, we'll use AppleScript for all characters
-            if IS_MACOS:
-                for char in text:
-                    if not self.typing_active:
-                        break
-                        
-                    # Type character using AppleScript
-                    type_with_applescript(char)
-                    
-                    # Update progress
-                    typed_chars += 1
-                    progress = int((typed_chars / total_chars) * 100)
-                    self.progress_signal.emit(progress)
-                    
-                    # Basic delay between characters
-                    # Slightly longer pause for certain characters
-                    if char in ['.', ',', '!', '?', ';', ':', ' ', '\n', '\t']:
-                        time.sleep(self.delay * 1.5)
-                    else:
-                        time.sleep(self.delay)
+            last_progress = -1
+            last_emit = 0.0
+            progress = 0
+
+            if not self.backend_loaded:
+                self.backend = backend_type.get_backend()
+                self.backend_loaded = True
+            if self.backend is None and not IS_MACOS:
+                load_pyautogui()
+
+            if IS_MACOS and self.fast_paste:
+                # Deliver the whole text with a single paste, unless
+                # stopped before it was sent
+                if stop_event.is_set():
+                    return
+                paste_with_applescript(text)
+                if not stop_event.is_set():
+                    self.progress_signal.emit(100)
+                    self.completed_signal.emit()
+                return
+
+            # Delays are computed once, so the loop only types and sleeps
+            delays = self.build_delay_schedule(text)
+
+            # Native key events are also built once for the whole text
+            backend = self.backend
+            if backend is not None:
+                key_buffer = backend.build_buffer(text)
+                schedule = self.group_schedule(delays)
+            elif IS_MACOS:
+                # A single osascript process types the whole text with the
+                # delays inside the script, reporting progress after each
+                # word as it goes
+                schedule = self.group_words(text, delays)
+                applescript = start_applescript(text, delays, schedule)
+                # Lets STOP terminate the script from the GUI thread
+                self.applescript = applescript
             else:
-                # For non-macOS, use pyautogui as before
-                for char in text:
-                    if not self.typing_active:
-                        break
-
-                    # Try multiple approaches for special characters
-                    if char in MAC_SPECIAL_CHARS:
-                        try:
-                            # First try: use direct key press
-                            pyautogui.press(MAC_SPECIAL_CHARS[char])
-                        except Exception:
-                            try:
-                                # Second try: use clipboard method
-                                original_clipboard = pyperclip.paste()
-                                pyperclip.copy(char)
-                                pyautogui.hotkey('command', 'v')
-                                time.sleep(0.1)
-                                pyperclip.copy(original_clipboard)
-                            except:
-                                # Last resort: try to write directly
-                                pyautogui.write(char)
-                    else:
-                        # Type regular character
-                        pyautogui.write(char)
-
-                    # Update progress
-                    typed_chars += 1
-                    progress = int((typed_chars / total_chars) * 100)
-                    self.progress_signal.emit(progress)
-
-                    # Basic delay between characters
-                    time.sleep(self.delay)
+                schedule = self.group_schedule(delays)
+
+            # Bind attributes used on every iteration to locals
+            emit_progress = self.progress_signal.emit
+            perf_counter = time.perf_counter
+
+            # Sleep until absolute deadlines so oversleeping and time spent
+            # sending keys don't accumulate into drift over long texts
+            deadline = perf_counter()
+
+            for start, end, chunk_delay in schedule:
+                if stop_event.is_set():
+                    break
+
+                if backend is not None:
+                    # Keep PyAutoGUI's fail-safe: a mouse in a screen
+                    # corner stops typing
+                    if backend.cursor_in_corner():
+                        raise RuntimeError(FAILSAFE_MESSAGE)
+                    # Native backend: one platform call per chunk
+                    backend.send(key_buffer, start, end)
+                elif applescript is not None:
+                    # Wait for the script to report the word typed; any
+                    # other output is an AppleScript error message
+                    line = applescript.stderr.readline().strip()
+                    if line != str(end):
+                        if stop_event.is_set():
+                            # Terminated by STOP
+                            break
+                        if not line:
+                            applescript.wait()
+                            line = ("osascript exited with status "
+                                    f"{applescript.returncode}")
+                        raise RuntimeError(line)
+                else:
+                    type_with_pyautogui(text[start:end], saved_clipboard)
+
+                # Update progress, signalling the GUI at most ~30 times a
+                # second and only when the percentage changes
+                typed_chars = end
+                progress = typed_chars * 100 // total_chars
+                now = perf_counter()
+                if (progress != last_progress
+                        and now - last_emit >= PROGRESS_INTERVAL):
+                    last_progress = progress
+                    last_emit = now
+                    emit_progress(progress)
+
+                if applescript is not None:
+                    # The script waits between keys itself
+                    continue
+
+                # Delay until the next chunk is due, returning early on stop
+                deadline += chunk_delay
+                remaining = deadline - perf_counter()
+                if remaining > 0 and stop_event.wait(remaining):
+                    break
+
+            # Flush the final progress value skipped by the throttle
+            if progress != last_progress:
+                emit_progress(progress)
 
             # Typing completed
-            if self.typing_active:
-                QTimer.singleShot(0, self.typing_completed)
+            if not stop_event.is_set():
+                self.completed_signal.emit()
 
         except Exception as exception:
             error_msg = f"Error during typing: {str(exception)}"
             print(error_msg)
-            QTimer.singleShot(
-                0, lambda: self.show_error(error_msg)
-            )
-            QTimer.singleShot(0, self.stop_typing)
+            # A stopped run's errors must not stop a newer run
+            if not stop_event.is_set():
+                self.error_signal.emit(error_msg)
+
+        finally:
+            backend_type.end_precise_timing()
+            if applescript is not None:
+                # Stop the script if typing was stopped before it finished
+                if applescript.poll() is None:
+                    applescript.terminate()
+                applescript.wait()
+                applescript.stderr.close()
+                if self.applescript is applescript:
+                    self.applescript = None
+            if saved_clipboard:
+                pyperclip.copy(saved_clipboard[0])
 
     def typing_completed(self):
         """Called when typing is completed successfully"""
         self.typing_active = False
-        self.max_timer.stop()
-        self.status_label.setText("Completed")
-        self.status_label.setStyleSheet(
-            "background-color: #d4edda; padding: 5px; border-radius: 3px;"
-        )
+        self.emergency_timer.stop()
+        self.stop_esc_listener()
+        self.set_status('completed')
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
 
-        QMessageBox.information(
-            self, "Completed", "Typing completed successfully"
-        )
+        # Non-modal notice so the next run isn't gated on a dialog
+        self.status_bar.showMessage("Typing completed successfully", 5000)
+
+    def typing_failed(self, message):
+        """Called when the typing thread raised an error"""
+        self.stop_typing()
+        self.show_error(message)
 
     def stop_typing(self):
         """Stop the typing process"""
@@ -421,12 +790,13 @@ class SimpleTyper(QMainWindow):
             return
 
         self.typing_active = False
-        self.max_timer.stop()
+        self.stop_event.set()
+        self.stop_applescript()
+        self.emergency_timer.stop()
+        self.countdown_timer.stop()
+        self.stop_esc_listener()
 
-        self.status_label.setText("Stopped")
-        self.status_label.setStyleSheet(
-            "background-color: #f8d7da; padding: 5px; border-radius: 3px;"
-        )
+        self.set_status('stopped')
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
 
@@ -434,30 +804,57 @@ class SimpleTyper(QMainWindow):
         """Emergency stop when maximum time is reached or Escape is pressed"""
         if self.typing_active:
             self.typing_active = False
-            self.max_timer.stop()
+            self.stop_event.set()
+            self.stop_applescript()
+            self.emergency_timer.stop()
+            self.countdown_timer.stop()
+            self.stop_esc_listener()
 
-            self.status_label.setText("EMERGENCY STOP")
-            self.status_label.setStyleSheet(
-                "background-color: #dc3545; color: white; "
-                "padding: 5px; border-radius: 3px;"
-            )
+            self.set_status('emergency')
             self.start_button.setEnabled(True)
             self.stop_button.setEnabled(False)
 
             msg = "Typing has been stopped by emergency timeout or ESC key"
-            QMessageBox.warning(
-                self, "Emergency Stop",
+            self.show_message(
+                QMessageBox.Icon.Warning, "Emergency Stop",
                 msg
             )
 
+    def stop_applescript(self):
+        """Terminate the running osascript process, if any
+
+        The script types a whole word between progress reports, so the
+        typing thread alone would only notice a stop at the next word.
+        """
+        applescript = self.applescript
+        if applescript is not None and applescript.poll() is None:
+            applescript.terminate()
+
     def show_error(self, message):
         """Show error message"""
-        QMessageBox.critical(self, "Error", message)
+        self.show_message(QMessageBox.Icon.Critical, "Error", message)
+
+    def show_message(self, icon, title, text,
+                     buttons=QMessageBox.StandardButton.Ok):
+        """Show a modal message box and return the button clicked
+
+        One box is created per title on first use and reused afterwards.
+        """
+        box = self.message_boxes.get(title)
+        if box is None:
+            box = QMessageBox(icon, title, "", buttons, self)
+            self.message_boxes[title] = box
+        box.setText(text)
+        box.exec()
+        return box.standardButton(box.clickedButton())
 
     def closeEvent(self, event):
         """Handle window close event"""
         if self.typing_active:
             self.typing_active = False
+            self.stop_event.set()
+            self.stop_applescript()
+        self.stop_esc_listener()
         event.accept()
 
 